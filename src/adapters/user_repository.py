@@ -1,9 +1,16 @@
 import logging
+from collections.abc import Sequence
+from typing import cast
 
+from sqlalchemy import CursorResult, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from src.adapters.base_repository import SqlAlchemyRepository
-from src.models.user import User
+from src.auth.exceptions import UserAlreadyExistsError
+from src.models.role import Role
+from src.models.user import User, user_roles
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +18,100 @@ logger = logging.getLogger(__name__)
 class SqlAlchemyUserRepository(SqlAlchemyRepository[User]):
     model = User
 
+    async def create(self, user: User) -> User:
+        """Insert the user, relying on the unique indexes for duplicate detection.
+
+        One INSERT replaces the select-then-insert pattern: a duplicate
+        email or username surfaces as an IntegrityError instead of costing
+        a read round-trip on every signup.
+        """
+        try:
+            async with self._session.begin_nested():
+                self.add(user)
+                await self._session.flush()
+        except IntegrityError as e:
+            raise UserAlreadyExistsError() from e
+        return user
+
+    async def attach_role(self, user_id: int, role_id: int) -> bool:
+        """Link a role to a user; returns False if the role id is stale."""
+        try:
+            async with self._session.begin_nested():
+                await self._session.execute(insert(user_roles).values(user_id=user_id, role_id=role_id))
+            return True
+        except IntegrityError:
+            return False
+
+    async def detach_role(self, user_id: int, role_id: int) -> bool:
+        """Unlink a role with one DELETE; returns False if it was not linked.
+
+        Targeting the association table directly skips loading user.roles
+        and the ORM's collection diffing. Callers holding a loaded user
+        should refresh the relationship if they read it afterwards.
+        """
+        # DELETE always runs on the cursor, but Session.execute is typed
+        # as the broader Result, which has no rowcount.
+        result = cast(
+            CursorResult,
+            await self._session.execute(
+                delete(user_roles).where(
+                    user_roles.c.user_id == user_id,
+                    user_roles.c.role_id == role_id,
+                )
+            ),
+        )
+        return result.rowcount > 0
+
+    async def touch_last_login(self, user_id: int) -> None:
+        """Stamp ``last_login`` server-side without loading the value back."""
+        await self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(last_login=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_by_id(
+        self,
+        obj_id: int,
+        *,
+        options: Sequence[ORMOption] = (),
+        for_update: bool = False,
+        nowait: bool = False,
+        skip_locked: bool = False,
+    ) -> User | None:
+        # Roles are lazy on the relationship; eager-load them here since
+        # every caller (token issuance, role checks) reads user.roles.
+        return await super().get_by_id(
+            obj_id,
+            options=options or [selectinload(User.roles)],
+            for_update=for_update,
+            nowait=nowait,
+            skip_locked=skip_locked,
+        )
+
+    async def get_with_role_names(self, user_id: int) -> tuple[User, list[str]] | None:
+        """Load a user plus bare role names in one joined query.
+
+        Token issuance only needs the names, so this skips materializing
+        Role instances and the selectin round-trip for the relationship.
+        """
+        stmt = (
+            select(User, Role.name)
+            .outerjoin(user_roles, user_roles.c.user_id == User.id)
+            .outerjoin(Role, Role.id == user_roles.c.role_id)
+            .where(User.id == user_id)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        if not rows:
+            return None
+        user = rows[0][0]
+        role_names = [name for _, name in rows if name is not None]
+        return user, role_names
+
     async def get_by_email(self, email: str) -> User | None:
         return await self.get_one(
-            User.email == email,
+            User.email_ci == email.lower(),
             options=[selectinload(User.roles)],
         )
 
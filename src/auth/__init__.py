@@ -4,8 +4,8 @@ from src.auth.exceptions import (
     TokenExpiredError,
     UserAlreadyExistsError,
 )
-from src.auth.jwt import create_access_token, create_refresh_token, decode_token
-from src.auth.password import get_password_hash, validate_password, verify_password
+from src.auth.jwt import create_access_token, create_refresh_token, decode_token, try_decode
+from src.auth.password import get_password_hash, validate_password, verify_password, verify_password_async
 from src.auth.schemas import TokenPayload, TokenType
 
 __all__ = [
@@ -19,6 +19,8 @@ __all__ = [
     "create_refresh_token",
     "decode_token",
     "get_password_hash",
+    "try_decode",
     "validate_password",
     "verify_password",
+    "verify_password_async",
 ]
@@ -1,11 +1,15 @@
 import secrets
 from datetime import UTC, datetime, timedelta
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from src.auth.schemas import TokenPayload, TokenType
 from src.core.settings import settings
 
+# Key object constructed once at import; passing the raw secret string
+# makes python-jose rebuild the HMAC key on every encode/decode call.
+_JWT_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
 
 def _to_unix_seconds(dt: datetime) -> int:
     return int(dt.timestamp())
@@ -29,7 +33,7 @@ def create_access_token(
         roles=roles or [],
         jti=jti or _generate_jti(),
     ).model_dump(exclude_none=True)
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def create_refresh_token(*, sub: str, jti: str | None = None) -> str:
@@ -42,14 +46,14 @@ def create_refresh_token(*, sub: str, jti: str | None = None) -> str:
         exp=_to_unix_seconds(expires_at),
         jti=jti or _generate_jti(),
     ).model_dump(exclude_none=True)
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def decode_token(token: str, *, verify_exp: bool = True) -> TokenPayload:
     options = {} if verify_exp else {"verify_exp": False}
     decoded = jwt.decode(
         token,
-        settings.JWT_SECRET_KEY,
+        _JWT_KEY,
         algorithms=[settings.JWT_ALGORITHM],
         options=options,
     )
@@ -59,3 +63,18 @@ def decode_token(token: str, *, verify_exp: bool = True) -> TokenPayload:
 def assert_token_type(payload: TokenPayload, expected: TokenType) -> None:
     if payload.type != expected:
         raise JWTError(f"Invalid token type: expected={expected}, got={payload.type}")
+
+
+def try_decode(token: str, expected: TokenType, *, verify_exp: bool = True) -> TokenPayload | None:
+    """Decode and type-check a token, returning None instead of raising.
+
+    Malformed tokens are the common case on abused endpoints; returning
+    None keeps the hot path free of exception construction and chaining.
+    """
+    try:
+        payload = decode_token(token, verify_exp=verify_exp)
+    except (JWTError, ValueError):
+        return None
+    if payload.type != expected:
+        return None
+    return payload
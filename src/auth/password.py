@@ -1,7 +1,24 @@
+import asyncio
+
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import Argon2Error, InvalidHashError
 
 from src.core.settings import settings
 
+_argon2_hasher = PasswordHasher()
+
+# Hash verified against when no account matches, so a login miss takes as
+# long as a wrong password and timing cannot reveal whether an email exists.
+if settings.PASSWORD_HASH_ALGO == "argon2id":
+    _DUMMY_HASH = _argon2_hasher.hash("dummy-password")
+else:
+    _DUMMY_HASH = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode("utf-8")
+
+# Hashing is CPU-bound; the semaphore keeps concurrent logins from
+# saturating the thread pool and thrashing every core.
+_verify_semaphore = asyncio.Semaphore(settings.PASSWORD_VERIFY_CONCURRENCY)
+
 
 def validate_password(password: str) -> None:
     if len(password) < settings.PASSWORD_MIN_LENGTH:
@@ -12,12 +29,34 @@ def validate_password(password: str) -> None:
 
 def get_password_hash(password: str) -> str:
     validate_password(password)
+    if settings.PASSWORD_HASH_ALGO == "argon2id":
+        return _argon2_hasher.hash(password)
     salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    # Dispatch on the hash itself so bcrypt hashes issued before a switch
+    # to argon2id keep verifying (and vice versa).
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _argon2_hasher.verify(hashed_password, plain_password)
+        except (Argon2Error, InvalidHashError):
+            return False
     try:
         return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
     except (ValueError, TypeError):
         return False
+
+
+async def verify_password_async(plain_password: str, hashed_password: str | None) -> bool:
+    """Verify in a worker thread so hashing does not block the event loop.
+
+    Pass ``None`` for ``hashed_password`` when no account matched: a dummy
+    hash is still verified and False returned.
+    """
+    async with _verify_semaphore:
+        if hashed_password is None:
+            await asyncio.to_thread(verify_password, plain_password, _DUMMY_HASH)
+            return False
+        return await asyncio.to_thread(verify_password, plain_password, hashed_password)
@@ -1,4 +1,5 @@
 import logging
+import time
 from datetime import UTC, datetime
 
 from src.cache.redis import cache_client
@@ -7,6 +8,18 @@ from src.core.settings import settings
 logger = logging.getLogger(__name__)
 
 _BLACKLIST_KEY_PREFIX = "token_blacklist:"
+_BLOOM_KEY_PREFIX = "token_blacklist:bf:"
+
+
+def _bloom_keys() -> tuple[str, str]:
+    """Current and previous Bloom-filter generation keys.
+
+    Generations rotate every refresh-token lifetime; a jti added late in
+    one generation is still covered by checking the previous filter, and
+    expired generations age out via their key TTL — no swap task needed.
+    """
+    bucket = int(time.time()) // settings.JWT_REFRESH_TOKEN_EXPIRE_SECONDS
+    return f"{_BLOOM_KEY_PREFIX}{bucket}", f"{_BLOOM_KEY_PREFIX}{bucket - 1}"
 
 
 async def is_token_blacklisted(jti: str) -> bool:
@@ -14,11 +27,19 @@ async def is_token_blacklisted(jti: str) -> bool:
         return False
 
     try:
+        if settings.CACHE_BLACKLIST_BLOOM:
+            current, previous = _bloom_keys()
+            pipe = cache_client.pipeline(transaction=False)
+            pipe.execute_command("BF.EXISTS", current, jti)
+            pipe.execute_command("BF.EXISTS", previous, jti)
+            current_hit, previous_hit = await pipe.execute()
+            return bool(current_hit or previous_hit)
+
         key = f"{_BLACKLIST_KEY_PREFIX}{jti}"
         exists = await cache_client.exists(key)
         return bool(exists)
     except Exception as e:
-        logger.error(f"Error checking token blacklist: {e}", exc_info=True)
+        logger.error("Error checking token blacklist: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return False
 
 
@@ -28,14 +49,24 @@ async def blacklist_token(jti: str, expires_at: datetime) -> None:
         return
 
     try:
+        if settings.CACHE_BLACKLIST_BLOOM:
+            current, _ = _bloom_keys()
+            pipe = cache_client.pipeline(transaction=False)
+            pipe.execute_command("BF.ADD", current, jti)
+            # Two generations keep every jti covered for a full token TTL.
+            pipe.expire(current, settings.JWT_REFRESH_TOKEN_EXPIRE_SECONDS * 2)
+            await pipe.execute()
+            logger.debug("Token blacklisted (bloom): %s", jti)
+            return
+
         key = f"{_BLACKLIST_KEY_PREFIX}{jti}"
         now = datetime.now(UTC)
         ttl_seconds = int((expires_at - now).total_seconds())
         if ttl_seconds > 0:
             await cache_client.setex(key, ttl_seconds, "1")
-            logger.debug(f"Token blacklisted: {jti}, expires in {ttl_seconds}s")
+            logger.debug("Token blacklisted: %s, expires in %ds", jti, ttl_seconds)
     except Exception as e:
-        logger.error(f"Error blacklisting token: {e}", exc_info=True)
+        logger.error("Error blacklisting token: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
 async def revoke_all_user_tokens(user_id: int) -> None:
@@ -47,6 +78,6 @@ async def revoke_all_user_tokens(user_id: int) -> None:
         key = f"user_token_revoked:{user_id}"
         max_ttl = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
         await cache_client.setex(key, max_ttl, str(int(datetime.now(UTC).timestamp())))
-        logger.info(f"All tokens revoked for user {user_id}")
+        logger.info("All tokens revoked for user %s", user_id)
     except Exception as e:
-        logger.error(f"Error revoking user tokens: {e}", exc_info=True)
+        logger.error("Error revoking user tokens: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
@@ -13,11 +13,7 @@ cache_client: Redis | None
 if settings.CACHE_ENABLED:
     cache_pool = ConnectionPool.from_url(
         settings.cache_url,
-        max_connections=settings.CACHE_MAX_CONNECTIONS,
-        decode_responses=False,
-        socket_timeout=settings.CACHE_SOCKET_TIMEOUT,
-        socket_connect_timeout=settings.CACHE_SOCKET_CONNECT_TIMEOUT,
-        retry_on_timeout=settings.CACHE_RETRY_ON_TIMEOUT,
+        **settings.connection_pool_kwargs,
     )
     cache_client = Redis(connection_pool=cache_pool)
 else:
@@ -35,4 +31,4 @@ async def close_cache() -> None:
             await cache_pool.aclose()
         logger.info("Disconnected from Redis cache")
     except Exception as e:
-        logger.warning(f"Error disconnecting from Redis: {e}", exc_info=True)
+        logger.warning("Error disconnecting from Redis: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
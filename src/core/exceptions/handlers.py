@@ -5,10 +5,10 @@ from typing import Any
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
-from starlette.responses import JSONResponse
 
 from src.core.exceptions.exceptions import ApplicationError
 from src.core.logger import request_id_context
+from src.core.responses import ORJSONResponse
 from src.core.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ def add_exception_handlers(app: FastAPI) -> None:
     )
 
     @app.exception_handler(RequestValidationError)
-    async def request_validation_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    async def request_validation_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
         """Handle FastAPI request validation errors."""
         request_id = _get_request_id(request)
         errors = exc.errors()
@@ -68,7 +68,7 @@ def add_exception_handlers(app: FastAPI) -> None:
             },
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             content={
                 "error": "Validation failed",
@@ -78,7 +78,7 @@ def add_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(PydanticValidationError)
-    async def pydantic_validation_handler(request: Request, exc: PydanticValidationError) -> JSONResponse:
+    async def pydantic_validation_handler(request: Request, exc: PydanticValidationError) -> ORJSONResponse:
         """Handle Pydantic validation errors."""
         request_id = _get_request_id(request)
         errors = exc.errors()
@@ -95,7 +95,7 @@ def add_exception_handlers(app: FastAPI) -> None:
             },
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={
                 "error": "Invalid input",
@@ -113,7 +113,7 @@ def add_exception_handlers(app: FastAPI) -> None:
     )
 
     @app.exception_handler(ApplicationError)
-    async def application_error_handler(request: Request, exc: ApplicationError) -> JSONResponse:
+    async def application_error_handler(request: Request, exc: ApplicationError) -> ORJSONResponse:
         """Handle all custom application errors."""
         request_id = _get_request_id(request)
         is_security_event = isinstance(exc, _SECURITY_EXCEPTIONS)
@@ -145,10 +145,10 @@ def add_exception_handlers(app: FastAPI) -> None:
         if exc.details is not None:
             content["details"] = exc.details
 
-        return JSONResponse(status_code=exc.status_code, content=content)
+        return ORJSONResponse(status_code=exc.status_code, content=content)
 
     @app.exception_handler(Exception)
-    async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         """Handle unhandled exceptions (catch-all for 500 errors)."""
         request_id = _get_request_id(request)
 
@@ -175,4 +175,4 @@ def add_exception_handlers(app: FastAPI) -> None:
         if details:
             content["details"] = details
 
-        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=content)
+        return ORJSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=content)
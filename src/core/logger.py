@@ -16,7 +16,18 @@ class RequestIDFilter(logging.Filter):
         return True
 
 
+_logging_configured = False
+
+
 def setup_logging() -> None:
+    # Idempotent: importers besides the ASGI entry (workers, scripts,
+    # tests) may call this again; only the first call pays for handler
+    # and formatter construction.
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.log_level_int)
     root_logger.handlers.clear()
@@ -24,7 +35,7 @@ def setup_logging() -> None:
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(settings.log_level_int)
 
-    if settings.LOG_FORMAT.lower() == "json":
+    if settings.log_format_is_json:
         if settings.LOG_INCLUDE_REQUEST_ID:
             fmt = "%(asctime)s %(name)s %(levelname)s %(message)s %(pathname)s %(lineno)d %(request_id)s"
         else:
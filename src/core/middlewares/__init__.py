@@ -1,8 +1,10 @@
+from .cors import CORSMiddleware
 from .logging import LoggingMiddleware
 from .request_size import RequestSizeLimitMiddleware
 from .security import SecurityHeadersMiddleware
 
 __all__ = [
+    "CORSMiddleware",
     "LoggingMiddleware",
     "RequestSizeLimitMiddleware",
     "SecurityHeadersMiddleware",
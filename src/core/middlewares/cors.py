@@ -0,0 +1,43 @@
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import ASGIApp
+
+
+class CORSMiddleware(StarletteCORSMiddleware):
+    """CORSMiddleware that reuses one prebuilt response for static preflights.
+
+    Starlette rebuilds the preflight header dict and a PlainTextResponse on
+    every OPTIONS preflight even though, for most configurations, the
+    successful response is identical each time. Build it once at init and
+    serve it whenever no header needs to be echoed back; anything dynamic
+    (explicit allow-origin, mirrored request headers, private network) falls
+    through to the stock implementation.
+    """
+
+    def __init__(self, app: ASGIApp, /, **kwargs: Any) -> None:
+        super().__init__(app, **kwargs)
+        self._static_preflight_response: Response = PlainTextResponse(
+            "OK",
+            status_code=200,
+            headers=self.preflight_headers,
+        )
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        if (
+            not self.preflight_explicit_allow_origin
+            and not self.allow_private_network
+            and "access-control-request-private-network" not in request_headers
+            and request_headers["access-control-request-method"] in self.allow_methods
+        ):
+            requested_headers = request_headers.get("access-control-request-headers")
+            if requested_headers is None:
+                return self._static_preflight_response
+            if not self.allow_all_headers and all(
+                h.strip() in self.allow_headers for h in requested_headers.lower().split(",")
+            ):
+                return self._static_preflight_response
+
+        return super().preflight_response(request_headers)
@@ -1,18 +1,22 @@
 import logging
 import time
 import uuid
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.logger import request_id_context
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
+    """Pure ASGI middleware for request/response logging with request IDs.
+
+    Implemented without BaseHTTPMiddleware to avoid its per-request task
+    group and response-streaming queue.
+    """
+
     def __init__(
         self,
         app: ASGIApp,
@@ -20,52 +24,65 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         log_slow_requests: bool = True,
         slow_request_threshold: float = 1.0,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.log_request_body = log_request_body
         self.log_slow_requests = log_slow_requests
         self.slow_request_threshold = slow_request_threshold
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        request_id = headers.get("X-Request-ID") or str(uuid.uuid4())
         request_id_context.set(request_id)
 
         start_time = time.time()
+        method = scope["method"]
+        path = scope["path"]
         request_body = None
 
         if self.log_request_body:
+            body, receive = await self._buffer_body(receive)
             try:
-                body_bytes = await request.body()
-                request_body = body_bytes.decode("utf-8", errors="replace")[:1000]
-                request._body = body_bytes
+                request_body = body.decode("utf-8", errors="replace")[:1000]
             except (UnicodeDecodeError, ValueError):
                 pass
 
+        query_string = scope.get("query_string", b"")
+        client = scope.get("client")
         logger.info(
             "Incoming request",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params) if request.query_params else None,
-                "client_host": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent"),
+                "method": method,
+                "path": path,
+                "query_params": query_string.decode("latin-1") if query_string else None,
+                "client_host": client[0] if client else None,
+                "user_agent": headers.get("user-agent"),
                 **({"body": request_body} if request_body else {}),
             },
         )
 
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
             process_time = time.time() - start_time
 
             log_data = {
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
+                "method": method,
+                "path": path,
+                "status_code": status_code,
                 "process_time": round(process_time, 3),
             }
 
@@ -77,17 +94,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             else:
                 logger.info("Request completed", extra=log_data)
 
-            response.headers["X-Request-ID"] = request_id
-            return response
-
         except Exception as exc:
             process_time = time.time() - start_time
             logger.error(
                 "Request failed",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "process_time": round(process_time, 3),
                     "error": str(exc),
                     "error_type": type(exc).__name__,
@@ -95,3 +109,27 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 exc_info=True,
             )
             raise
+
+    @staticmethod
+    async def _buffer_body(receive: Receive) -> tuple[bytes, Receive]:
+        """Drain the request body and return it with a replaying receive."""
+        chunks: list[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay
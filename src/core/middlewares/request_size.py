@@ -1,47 +1,102 @@
 import logging
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
+class RequestSizeLimitMiddleware:
+    """Pure ASGI middleware rejecting requests whose body size is too large.
+
+    Requests declaring Content-Length are rejected before any body bytes
+    are read. Chunked requests (no Content-Length) are counted as chunks
+    arrive and aborted as soon as the cumulative size crosses the limit,
+    so the body is never buffered here either way.
+    """
+
     def __init__(self, app: ASGIApp, max_size: int) -> None:
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        content_length = request.headers.get("content-length")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        content_length = headers.get("content-length")
         if not content_length:
-            return await call_next(request)
+            await self._call_counting_body(scope, receive, send, headers)
+            return
 
         try:
             size = int(content_length)
         except ValueError:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         if size <= self.max_size:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        self._log_rejection(scope, headers, size)
+        await self._too_large_response(size)(scope, receive, send)
+
+    async def _call_counting_body(self, scope: Scope, receive: Receive, send: Send, headers: Headers) -> None:
+        """Run the app with a receive wrapper that aborts oversized chunked bodies."""
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    self._log_rejection(scope, headers, received)
+                    if not response_started:
+                        rejected = True
+                        await self._too_large_response(received)(scope, receive, send)
+                    # Unwind the downstream body read instead of draining
+                    # the rest of the stream.
+                    return {"type": "http.disconnect"}
+            return message
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # The fabricated disconnect makes Starlette's body reader
+            # raise ClientDisconnect downstream. Once the 413 has been
+            # sent that unwind is expected; anything else propagates.
+            if not rejected:
+                raise
 
+    def _log_rejection(self, scope: Scope, headers: Headers, size: int) -> None:
         logger.warning(
             "Request body size exceeds limit",
             extra={
-                "request_id": request.headers.get("X-Request-ID", "unknown"),
-                "path": request.url.path,
+                "request_id": headers.get("X-Request-ID", "unknown"),
+                "path": scope["path"],
                 "size": size,
                 "max_size": self.max_size,
             },
         )
 
-        return JSONResponse(
+    def _too_large_response(self, size: int) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=status.HTTP_413_CONTENT_TOO_LARGE,
             content={
                 "error": "Request entity too large",
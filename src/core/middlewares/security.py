@@ -1,11 +1,15 @@
-from collections.abc import Awaitable, Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
 
+class SecurityHeadersMiddleware:
+    """Pure ASGI middleware adding security headers to every HTTP response.
+
+    Implemented without BaseHTTPMiddleware to avoid its per-request task
+    group and response-streaming queue. The header values never change
+    after construction, so they are encoded once here and appended to the
+    raw header list with a single concatenation per response.
+    """
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
         app: ASGIApp,
@@ -17,35 +21,29 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         referrer_policy: str = "strict-origin-when-cross-origin",
         permissions_policy: str | None = None,
     ) -> None:
-        super().__init__(app)
-        self.x_content_type_options = x_content_type_options
-        self.x_frame_options = x_frame_options
-        self.x_xss_protection = x_xss_protection
-        self.strict_transport_security = strict_transport_security
-        self.content_security_policy = content_security_policy
-        self.referrer_policy = referrer_policy
-        self.permissions_policy = permissions_policy
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        response = await call_next(request)
-
-        response.headers["X-Content-Type-Options"] = self.x_content_type_options
-        response.headers["X-Frame-Options"] = self.x_frame_options
-        response.headers["X-XSS-Protection"] = self.x_xss_protection
-
-        if self.strict_transport_security:
-            response.headers["Strict-Transport-Security"] = self.strict_transport_security
-
-        if self.content_security_policy:
-            response.headers["Content-Security-Policy"] = self.content_security_policy
-
-        response.headers["Referrer-Policy"] = self.referrer_policy
-
-        if self.permissions_policy:
-            response.headers["Permissions-Policy"] = self.permissions_policy
-
-        return response
+        self.app = app
+        self._extra_headers: list[tuple[bytes, bytes]] = [
+            (name, value.encode("latin-1"))
+            for name, value in (
+                (b"x-content-type-options", x_content_type_options),
+                (b"x-frame-options", x_frame_options),
+                (b"x-xss-protection", x_xss_protection),
+                (b"strict-transport-security", strict_transport_security),
+                (b"content-security-policy", content_security_policy),
+                (b"referrer-policy", referrer_policy),
+                (b"permissions-policy", permissions_policy),
+            )
+            if value
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers") or []) + self._extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
@@ -0,0 +1,21 @@
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson serializes several times faster than the stdlib encoder and
+    emits UTF-8 bytes directly, skipping the ``str.encode`` round-trip.
+    Defined here because FastAPI deprecated its own ``ORJSONResponse``;
+    this keeps the fast path without per-response deprecation warnings.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
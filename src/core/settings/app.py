@@ -11,7 +11,6 @@ class AppSettings(BaseSettings):
     API_V1_PREFIX: str = Field(
         default="/api/v1",
         description="URL prefix for API v1 endpoints",
-        pattern=r"^/.*",
     )
 
     ENVIRONMENT: Literal[
@@ -54,7 +53,6 @@ class AppSettings(BaseSettings):
     DOC_OPENAPI_URL: str = Field(
         default="/api/openapi.json",
         description="URL path for OpenAPI JSON schema",
-        pattern=r"^/.*",
     )
     DOC_OPENAPI_VERSION: str = Field(
         default="3.0.2",
@@ -63,12 +61,10 @@ class AppSettings(BaseSettings):
     DOC_SWAGGER_URL: str = Field(
         default="/api/docs",
         description="URL path for Swagger UI documentation",
-        pattern=r"^/.*",
     )
     DOC_REDOC_URL: str = Field(
         default="/api/redoc",
         description="URL path for ReDoc documentation",
-        pattern=r"^/.*",
     )
 
     CORS_ALLOW_ORIGINS: list[str] = Field(
@@ -161,14 +157,6 @@ class AppSettings(BaseSettings):
         default="100/minute",
         description="Default rate limit for all endpoints (format: 'count/period', e.g., '100/minute', '10/second')",
     )
-    RATE_LIMIT_STORAGE_URI: str | None = Field(
-        default=None,
-        description=(
-            "Redis URI for rate limiting storage. "
-            "If None, uses in-memory storage (not recommended for production with multiple workers). "
-            "Example: 'redis://localhost:6379/1'"
-        ),
-    )
     RATE_LIMIT_HEADERS_ENABLED: bool = Field(
         default=True,
         description="Include rate limit headers in responses (X-RateLimit-Limit, X-RateLimit-Remaining, etc.)",
@@ -197,6 +185,14 @@ class AppSettings(BaseSettings):
     def normalize_environment(cls, v: str) -> str:
         return v.lower() if isinstance(v, str) else v
 
+    @field_validator("API_V1_PREFIX", "DOC_OPENAPI_URL", "DOC_SWAGGER_URL", "DOC_REDOC_URL")
+    @classmethod
+    def must_start_with_slash(cls, v: str) -> str:
+        # Cheaper than the pattern=r"^/.*" regex these fields used to carry.
+        if not v.startswith("/"):
+            raise ValueError("URL path must start with '/'")
+        return v
+
     @property
     def is_production(self) -> bool:
         return getattr(self, "ENVIRONMENT", "development") == "production"
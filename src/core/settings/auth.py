@@ -49,11 +49,28 @@ class AuthSettings(BaseSettings):
         ge=6,
         description="Minimum password length",
     )
+    PASSWORD_HASH_ALGO: Literal[
+        "bcrypt",
+        "argon2id",
+    ] = Field(
+        default="bcrypt",
+        description=(
+            "Password hashing algorithm for new hashes. 'argon2id' is faster "
+            "per equivalent security level on modern CPUs; opt in per "
+            "deployment. Existing hashes are verified by their own algorithm "
+            "regardless."
+        ),
+    )
     BCRYPT_ROUNDS: int = Field(
         default=12,
         ge=10,
         le=20,
-        description="Bcrypt hashing rounds",
+        description="Bcrypt hashing rounds (used when PASSWORD_HASH_ALGO='bcrypt')",
+    )
+    PASSWORD_VERIFY_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        description="Max password verifications running concurrently in worker threads",
     )
     DEFAULT_USER_ROLE: str = Field(
         default="user",
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any
 
 from pydantic import Field
@@ -19,6 +20,14 @@ class CacheSettings(BaseSettings):
         le=65535,
         description="Redis cache port",
     )
+    CACHE_UNIX_SOCKET_PATH: str | None = Field(
+        default=None,
+        description=(
+            "Path to a Redis Unix domain socket (e.g. '/var/run/redis/redis.sock'). "
+            "If set, it is preferred over CACHE_HOST/CACHE_PORT to avoid TCP overhead "
+            "when Redis is co-located with the application."
+        ),
+    )
     CACHE_PASSWORD: str | None = Field(
         default=None,
         description="Redis cache password (optional)",
@@ -48,6 +57,14 @@ class CacheSettings(BaseSettings):
         default=True,
         description="Retry operations on timeout",
     )
+    CACHE_HEALTH_CHECK_INTERVAL: int = Field(
+        default=30,
+        ge=0,
+        description=(
+            "Seconds between health checks on pooled Redis connections "
+            "(0 disables). Keeps long-lived connections from going stale."
+        ),
+    )
     CACHE_DEFAULT_TTL: int = Field(
         default=300,
         ge=1,
@@ -57,6 +74,22 @@ class CacheSettings(BaseSettings):
         default="fastapi-cache",
         description="Prefix for cache keys generated by fastapi-cache2",
     )
+    CACHE_READINESS_PING_TTL: int = Field(
+        default=5,
+        ge=0,
+        description=(
+            "Seconds a successful readiness PING is reused before Redis is "
+            "pinged again (0 pings on every probe). Failures are never cached."
+        ),
+    )
+    CACHE_BLACKLIST_BLOOM: bool = Field(
+        default=False,
+        description=(
+            "Store the token blacklist in rotating Bloom filters (BF.ADD/BF.EXISTS) "
+            "instead of one key per jti. Requires the RedisBloom server module. "
+            "False positives only force a re-login, but memory drops ~20x."
+        ),
+    )
 
     def model_post_init(self, __context: Any) -> None:
         if not getattr(self, "is_production", False):
@@ -72,6 +105,22 @@ class CacheSettings(BaseSettings):
 
     @property
     def cache_url(self: "CacheSettings") -> str:
+        if self.CACHE_UNIX_SOCKET_PATH:
+            if self.CACHE_PASSWORD:
+                return f"unix://:{self.CACHE_PASSWORD}@{self.CACHE_UNIX_SOCKET_PATH}?db={self.CACHE_DB}"
+            return f"unix://{self.CACHE_UNIX_SOCKET_PATH}?db={self.CACHE_DB}"
         if self.CACHE_PASSWORD:
             return f"redis://:{self.CACHE_PASSWORD}@{self.CACHE_HOST}:{self.CACHE_PORT}/{self.CACHE_DB}"
         return f"redis://{self.CACHE_HOST}:{self.CACHE_PORT}/{self.CACHE_DB}"
+
+    @cached_property
+    def connection_pool_kwargs(self: "CacheSettings") -> dict[str, Any]:
+        """Keyword arguments for ConnectionPool.from_url, built once."""
+        return {
+            "max_connections": self.CACHE_MAX_CONNECTIONS,
+            "decode_responses": False,
+            "socket_timeout": self.CACHE_SOCKET_TIMEOUT,
+            "socket_connect_timeout": self.CACHE_SOCKET_CONNECT_TIMEOUT,
+            "retry_on_timeout": self.CACHE_RETRY_ON_TIMEOUT,
+            "health_check_interval": self.CACHE_HEALTH_CHECK_INTERVAL,
+        }
@@ -1,3 +1,4 @@
+from functools import cached_property
 from urllib.parse import quote_plus
 
 from pydantic import Field
@@ -51,6 +52,20 @@ class DatabaseSettings(BaseSettings):
         default=False,
         description="Enable SQLAlchemy query logging (useful for debugging)",
     )
+    DB_READINESS_PING_TTL: int = Field(
+        default=5,
+        ge=0,
+        description=(
+            "Seconds a successful readiness SELECT 1 is reused before the "
+            "database is probed again (0 probes every call). Failures are "
+            "never cached."
+        ),
+    )
+    DB_READINESS_TIMEOUT: float = Field(
+        default=1.0,
+        gt=0,
+        description="Timeout in seconds for the readiness probe's pool acquire plus SELECT 1",
+    )
 
     def model_post_init(self, _) -> None:
         if not getattr(self, "is_production", False):
@@ -77,9 +92,9 @@ class DatabaseSettings(BaseSettings):
                 "secret management service."
             )
 
-    @property
+    @cached_property
     def db_url(self: "DatabaseSettings") -> str:
-        """Build db URL with properly encoded credentials."""
+        """Build db URL with properly encoded credentials (computed once)."""
         user = quote_plus(self.DB_USER)
         password = quote_plus(self.DB_PASSWORD)
         return f"postgresql+asyncpg://{user}:{password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
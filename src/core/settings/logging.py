@@ -1,4 +1,5 @@
 import logging
+from functools import cached_property
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -41,6 +42,10 @@ class LoggingSettings(BaseSettings):
         description="Threshold in seconds for logging slow requests",
     )
 
-    @property
+    @cached_property
     def log_level_int(self: "LoggingSettings") -> int:
         return getattr(logging, self.LOG_LEVEL.upper(), logging.INFO)
+
+    @cached_property
+    def log_format_is_json(self: "LoggingSettings") -> bool:
+        return self.LOG_FORMAT.lower() == "json"
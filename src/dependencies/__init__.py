@@ -0,0 +1,9 @@
+from src.dependencies.adapters import get_roles_repository, get_users_repository
+from src.dependencies.services import get_auth_service, get_health_service
+
+__all__ = [
+    "get_auth_service",
+    "get_health_service",
+    "get_roles_repository",
+    "get_users_repository",
+]
@@ -6,13 +6,13 @@ from src.adapters.user_repository import SqlAlchemyUserRepository
 from src.db.db import get_session
 
 
-async def get_users_repository(
+def get_users_repository(
     session: AsyncSession = Depends(get_session),
 ) -> SqlAlchemyUserRepository:
     return SqlAlchemyUserRepository(session=session)
 
 
-async def get_roles_repository(
+def get_roles_repository(
     session: AsyncSession = Depends(get_session),
 ) -> SqlAlchemyRoleRepository:
     return SqlAlchemyRoleRepository(session=session)
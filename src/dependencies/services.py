@@ -13,7 +13,7 @@ def get_health_service() -> HealthService:
     return HealthService(engine, cache_client)
 
 
-async def get_auth_service(
+def get_auth_service(
     users: SqlAlchemyUserRepository = Depends(get_users_repository),
     roles: SqlAlchemyRoleRepository = Depends(get_roles_repository),
 ) -> AuthService:
@@ -2,23 +2,23 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
-from slowapi.errors import RateLimitExceeded
 
 from src.api.router import router
 from src.cache.redis import cache_client, close_cache
 from src.core.exceptions import add_exception_handlers
 from src.core.logger import setup_logging
 from src.core.middlewares import (
+    CORSMiddleware,
     LoggingMiddleware,
     RequestSizeLimitMiddleware,
     SecurityHeadersMiddleware,
 )
+from src.core.responses import ORJSONResponse
 from src.db.db import engine
-from src.rate_limit import get_rate_limit_exceeded_handler, limiter
+from src.rate_limit import RateLimitMiddleware
 
 setup_logging()
 
@@ -52,6 +52,7 @@ def create_app() -> FastAPI:
         redoc_url=settings.DOC_REDOC_URL,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     app.openapi_version = settings.DOC_OPENAPI_VERSION
 
@@ -96,8 +97,7 @@ def create_app() -> FastAPI:
         )
 
     if settings.RATE_LIMIT_ENABLED:
-        app.state.limiter = limiter
-        app.add_exception_handler(RateLimitExceeded, get_rate_limit_exceeded_handler())
+        app.add_middleware(RateLimitMiddleware)
         logger.info(f"Rate limiting enabled with default limit: {settings.RATE_LIMIT_DEFAULT}")
 
     add_exception_handlers(app)
@@ -0,0 +1,48 @@
+"""Add generated email_ci column
+
+Revision ID: 3e8d51b7ac04
+Revises: 7c41d20a9e35
+Create Date: 2026-08-29 14:37:25.190347
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8d51b7ac04"
+down_revision: str | Sequence[str] | None = "7c41d20a9e35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The stored generated column replaces the functional lower(email)
+    # index: the database keeps the lowercased copy up to date and lookups
+    # compare against a plain indexed column.
+    op.add_column(
+        "users",
+        sa.Column(
+            "email_ci",
+            sa.String(length=255),
+            sa.Computed("lower(email)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_users_email_ci", "users", ["email_ci"], unique=True)
+    op.drop_index("ix_users_email_lower", table_name="users")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+    op.drop_index("ix_users_email_ci", table_name="users")
+    op.drop_column("users", "email_ci")
@@ -0,0 +1,47 @@
+"""Add email indexes for auth lookups
+
+Revision ID: 7c41d20a9e35
+Revises: 59fb26335db9
+Create Date: 2026-08-29 10:14:02.482911
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c41d20a9e35"
+down_revision: str | Sequence[str] | None = "59fb26335db9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Uniqueness moves to the case-insensitive functional index, which is
+    # also the index login lookups on lower(email) can use.
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=False)
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+    op.create_index(
+        "ix_users_email_active",
+        "users",
+        ["email"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_email_active", table_name="users")
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
@@ -21,7 +21,6 @@ class Role(BaseModel):
         "User",
         secondary="user_roles",
         back_populates="roles",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
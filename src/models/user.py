@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table
+from sqlalchemy import Column, Computed, DateTime, ForeignKey, Index, Integer, String, Table, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -21,8 +21,19 @@ class User(BaseModel):
     """User model for authentication."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive uniqueness on the stored generated column; also
+        # the index hit by login lookups, which filter on email_ci.
+        Index("ix_users_email_ci", "email_ci", unique=True),
+        # Partial index for exact-email lookups restricted to active users.
+        Index("ix_users_email_active", "email", postgresql_where=text("is_active")),
+    )
 
-    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    # The database maintains the lowercased copy, so lookups never compute
+    # lower() at runtime and duplicate emails differing only in case are
+    # rejected even if some code path forgets to normalize.
+    email_ci: Mapped[str] = mapped_column(String(255), Computed("lower(email)", persisted=True), nullable=False)
     username: Mapped[str | None] = mapped_column(String(100), unique=True, index=True, nullable=True)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
@@ -33,7 +44,6 @@ class User(BaseModel):
         "Role",
         secondary=user_roles,
         back_populates="users",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
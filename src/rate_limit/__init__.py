@@ -1,7 +1,8 @@
-from .limiter import get_rate_limit_exceeded_handler, limiter, rate_limit
+from .asgi_limiter import RateLimitMiddleware, parse_limit
+from .limiter import rate_limit
 
 __all__ = [
-    "get_rate_limit_exceeded_handler",
-    "limiter",
+    "RateLimitMiddleware",
+    "parse_limit",
     "rate_limit",
 ]
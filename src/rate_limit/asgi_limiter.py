@@ -0,0 +1,177 @@
+import logging
+import re
+import time
+from collections.abc import Iterator
+
+from fastapi import status
+from starlette.routing import BaseRoute, Route, compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.cache.redis import cache_client
+from src.core.responses import ORJSONResponse
+from src.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_MILLISECONDS = {
+    "second": 1_000,
+    "minute": 60_000,
+    "hour": 3_600_000,
+    "day": 86_400_000,
+}
+
+# INCR + PEXPIRE + PTTL in one round-trip; fixed-window counter.
+_INCR_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+local ttl = redis.call('PTTL', KEYS[1])
+return {count, ttl}
+"""
+
+
+def parse_limit(limit: str) -> tuple[int, int]:
+    """Parse a 'count/period' limit string into (count, window_ms)."""
+    count_str, _, period = limit.partition("/")
+    try:
+        count = int(count_str)
+        window_ms = _WINDOW_MILLISECONDS[period.strip().lower()]
+    except (ValueError, KeyError) as e:
+        raise ValueError(f"Invalid rate limit string: {limit!r}") from e
+    if count < 1:
+        raise ValueError(f"Invalid rate limit string: {limit!r}")
+    return count, window_ms
+
+
+class RateLimitMiddleware:
+    """Pure ASGI fixed-window rate limiter backed by Redis.
+
+    Per-route limits come from the @rate_limit decorator, which tags
+    endpoint functions; the route index (compiled path regex, methods,
+    limit) is built once from the application's routes on first request.
+    Counting uses a single Lua script (INCR + PEXPIRE + PTTL) so each
+    request costs one Redis round-trip. Without Redis, an in-process
+    counter is used (not shared across workers).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.headers_enabled = settings.RATE_LIMIT_HEADERS_ENABLED
+        self._route_index: list[tuple[re.Pattern[str], frozenset[str], int, int, str]] | None = None
+        self._script = cache_client.register_script(_INCR_SCRIPT) if cache_client is not None else None
+        self._local_counters: dict[str, tuple[int, float]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._route_index is None:
+            self._route_index = self._build_route_index(scope["app"].routes)
+
+        match = self._match_route(scope)
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        count_limit, window_ms, route_path = match
+        key = f"rate_limit:{route_path}:{self._client_key(scope)}"
+        current, reset_ms = await self._incr(key, window_ms)
+        remaining = max(count_limit - current, 0)
+        reset_at = int(time.time() + reset_ms / 1000)
+
+        if current > count_limit:
+            logger.warning(
+                "Rate limit exceeded",
+                extra={"path": scope["path"], "key": key, "limit": count_limit},
+            )
+            response = ORJSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"error": f"Rate limit exceeded: {count_limit} per {window_ms // 1000} seconds"},
+                headers=self._rate_limit_headers(count_limit, remaining, reset_at),
+            )
+            await response(scope, receive, send)
+            return
+
+        if not self.headers_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] += [
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in self._rate_limit_headers(count_limit, remaining, reset_at).items()
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
+
+    def _rate_limit_headers(self, limit: int, remaining: int, reset_at: int) -> dict[str, str]:
+        if not self.headers_enabled:
+            return {}
+        return {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset_at),
+        }
+
+    @staticmethod
+    def _client_key(scope: Scope) -> str:
+        client = scope.get("client")
+        return client[0] if client else "127.0.0.1"
+
+    @classmethod
+    def _build_route_index(cls, routes: list[BaseRoute]) -> list[tuple[re.Pattern[str], frozenset[str], int, int, str]]:
+        index = []
+        for prefix, route in cls._iter_routes(routes):
+            limit = getattr(route.endpoint, "__rate_limit__", None)
+            if limit is None:
+                continue
+            count, window_ms = parse_limit(limit)
+            methods = frozenset(route.methods or ())
+            full_path = prefix + route.path
+            path_regex, _, _ = compile_path(full_path)
+            index.append((path_regex, methods, count, window_ms, full_path))
+        return index
+
+    @classmethod
+    def _iter_routes(cls, routes: list[BaseRoute], prefix: str = "") -> Iterator[tuple[str, Route]]:
+        """Yield (accumulated prefix, concrete route), descending into included routers."""
+        for route in routes:
+            # FastAPI may defer include_router() into wrapper objects holding
+            # the original router plus the include prefix; unwrap them.
+            original_router = getattr(route, "original_router", None)
+            if original_router is not None:
+                include_prefix = getattr(getattr(route, "include_context", None), "prefix", "")
+                yield from cls._iter_routes(original_router.routes, prefix + include_prefix)
+            elif isinstance(route, Route):
+                yield prefix, route
+
+    def _match_route(self, scope: Scope) -> tuple[int, int, str] | None:
+        path = scope["path"]
+        method = scope["method"]
+        for path_regex, methods, count, window_ms, route_path in self._route_index or ():
+            if method in methods and path_regex.match(path):
+                return count, window_ms, route_path
+        return None
+
+    async def _incr(self, key: str, window_ms: int) -> tuple[int, int]:
+        """Increment the window counter; returns (count, ms until reset)."""
+        if self._script is not None:
+            try:
+                count, ttl = await self._script(keys=[key], args=[window_ms])
+                return int(count), max(int(ttl), 0)
+            except Exception as e:
+                logger.error("Rate limit Redis error, failing open: %s", e)
+                return 1, window_ms
+
+        now = time.monotonic()
+        count, expires_at = self._local_counters.get(key, (0, 0.0))
+        if now >= expires_at:
+            count, expires_at = 0, now + window_ms / 1000
+        count += 1
+        self._local_counters[key] = (count, expires_at)
+        return count, int((expires_at - now) * 1000)
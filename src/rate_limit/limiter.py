@@ -1,42 +1,15 @@
-import logging
 from collections.abc import Callable
 
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-
 from src.core.settings import settings
-
-logger = logging.getLogger(__name__)
-
-if settings.RATE_LIMIT_STORAGE_URI:
-    limiter = Limiter(
-        key_func=get_remote_address,
-        storage_uri=settings.RATE_LIMIT_STORAGE_URI,
-        headers_enabled=settings.RATE_LIMIT_HEADERS_ENABLED,
-    )
-    logger.info(
-        "Rate limiter initialized with Redis storage: %s",
-        settings.RATE_LIMIT_STORAGE_URI,
-    )
-else:
-    limiter = Limiter(
-        key_func=get_remote_address,
-        headers_enabled=settings.RATE_LIMIT_HEADERS_ENABLED,
-    )
-    logger.warning(
-        "Rate limiter using in-memory storage. "
-        "This is not recommended for production with multiple workers. "
-        "Set RATE_LIMIT_STORAGE_URI to use Redis."
-    )
-
-
-def get_rate_limit_exceeded_handler() -> Callable:
-    return _rate_limit_exceeded_handler
+from src.rate_limit.asgi_limiter import parse_limit
 
 
 def rate_limit(limit: str | None = None) -> Callable:
     """Decorator for applying rate limits to endpoints.
 
+    Tags the endpoint with its limit; enforcement happens in
+    RateLimitMiddleware, which indexes tagged routes at startup.
+
     Args:
         limit: Rate limit string (e.g., '10/minute', '100/hour').
             If None, uses the default from settings.
@@ -50,12 +23,11 @@ def rate_limit(limit: str | None = None) -> Callable:
         async def endpoint(request: Request, response: Response):
             return {"data": "value"}
     """
-    if not settings.RATE_LIMIT_ENABLED:
-
-        def noop_decorator(func):
-            return func
+    limit_str = limit or settings.RATE_LIMIT_DEFAULT
+    parse_limit(limit_str)  # fail fast on malformed limits at decoration time
 
-        return noop_decorator
+    def decorator(func):
+        func.__rate_limit__ = limit_str
+        return func
 
-    limit_str = limit or settings.RATE_LIMIT_DEFAULT
-    return limiter.limit(limit_str)
+    return decorator
@@ -1,6 +1,9 @@
+import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import Final
+from typing import ClassVar, Final
+
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.adapters.role_repository import SqlAlchemyRoleRepository
 from src.adapters.user_repository import SqlAlchemyUserRepository
@@ -8,10 +11,9 @@ from src.auth.exceptions import (
     InvalidCredentialsError,
     InvalidTokenError,
     TokenExpiredError,
-    UserAlreadyExistsError,
 )
-from src.auth.jwt import assert_token_type, create_access_token, create_refresh_token, decode_token
-from src.auth.password import get_password_hash, verify_password
+from src.auth.jwt import create_access_token, create_refresh_token, try_decode
+from src.auth.password import get_password_hash, verify_password_async
 from src.auth.token_blacklist import blacklist_token, is_token_blacklisted
 from src.core.settings import settings
 from src.models.user import User
@@ -22,6 +24,11 @@ logger = logging.getLogger(__name__)
 class AuthService:
     _DEFAULT_ROLE_DESCRIPTION: Final[str] = "Default role assigned to newly registered users."
 
+    # Process-wide cache of the default role's id; set on the first signup so
+    # later signups skip the role lookup round-trip. attach_role() reports a
+    # stale id (e.g. after a schema reset), in which case we re-resolve.
+    _default_role_id: ClassVar[int | None] = None
+
     def __init__(
         self,
         users: SqlAlchemyUserRepository,
@@ -37,21 +44,22 @@ class AuthService:
             user = await self._users.get_by_username(identifier)
 
         if user is None or not user.is_active:
+            # Burn a dummy verification so the miss is not observably faster.
+            await verify_password_async(password, None)
             return None
 
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
 
-        user.last_login = datetime.now(UTC)
+        # Server-side timestamp: no refreshed attribute to load back on
+        # the hot login path. The UPDATE skips session synchronization,
+        # so mirror the stamp onto the loaded instance (as committed
+        # state, not a pending change) for callers that read it.
+        await self._users.touch_last_login(user.id)
+        set_committed_value(user, "last_login", datetime.now(UTC))
         return user
 
     async def create_user(self, email: str, password: str, username: str | None) -> User:
-        if await self._users.get_by_email(email) is not None:
-            raise UserAlreadyExistsError()
-
-        if username and await self._users.get_by_username(username) is not None:
-            raise UserAlreadyExistsError()
-
         user = User(
             email=email,
             username=username,
@@ -59,14 +67,23 @@ class AuthService:
             is_active=True,
             is_superuser=False,
         )
+        await self._users.create(user)
+
+        role_id = AuthService._default_role_id
+        if role_id is None or not await self._users.attach_role(user.id, role_id):
+            default_role = await self._roles.get_or_create(
+                name=settings.DEFAULT_USER_ROLE,
+                description=self._DEFAULT_ROLE_DESCRIPTION,
+            )
+            AuthService._default_role_id = default_role.id
+            if not await self._users.attach_role(user.id, default_role.id):
+                # The id was just re-resolved, so this is not staleness;
+                # the user exists without its default role.
+                logger.error(
+                    "Failed to attach default role after re-resolving it",
+                    extra={"user_id": user.id, "role_id": default_role.id},
+                )
 
-        default_role = await self._roles.get_or_create(
-            name=settings.DEFAULT_USER_ROLE,
-            description=self._DEFAULT_ROLE_DESCRIPTION,
-        )
-        user.roles.append(default_role)
-
-        self._users.add(user)
         return user
 
     async def get_user_by_id(self, user_id: int) -> User | None:
@@ -86,42 +103,56 @@ class AuthService:
         return access_token, refresh_token, user
 
     async def refresh_access_token(self, refresh_token: str) -> tuple[str, str]:
-        try:
-            payload = decode_token(refresh_token)
-            assert_token_type(payload, "refresh")
-        except Exception as e:
-            logger.warning("Invalid refresh token", extra={"error": str(e)})
-            raise InvalidTokenError() from e
+        payload = try_decode(refresh_token, "refresh")
+        if payload is None:
+            logger.warning("Invalid refresh token")
+            raise InvalidTokenError()
 
         if payload.is_expired():
             raise TokenExpiredError()
 
-        if payload.jti and await is_token_blacklisted(payload.jti):
-            logger.warning("Attempted use of blacklisted refresh token", extra={"jti": payload.jti})
-            raise InvalidTokenError("Token has been revoked")
-
         try:
             user_id = int(payload.sub)
         except (ValueError, TypeError) as e:
             raise InvalidTokenError() from e
 
-        user = await self.get_user_by_id(user_id)
-        if user is None or not user.is_active:
+        if payload.jti:
+            # The blacklist lives in Redis and the user in Postgres; the two
+            # lookups are independent, so overlap them instead of paying both
+            # round-trips back to back.
+            async with asyncio.TaskGroup() as tg:
+                blacklisted_task = tg.create_task(is_token_blacklisted(payload.jti))
+                user_task = tg.create_task(self._users.get_with_role_names(user_id))
+            if blacklisted_task.result():
+                logger.warning("Attempted use of blacklisted refresh token", extra={"jti": payload.jti})
+                raise InvalidTokenError("Token has been revoked")
+            loaded = user_task.result()
+        else:
+            loaded = await self._users.get_with_role_names(user_id)
+
+        if loaded is None:
+            raise InvalidTokenError()
+        user, role_names = loaded
+        if not user.is_active:
             raise InvalidTokenError()
 
+        # Kick off the blacklist write, then encode the new tokens while the
+        # Redis round-trip is in flight; the two have no data dependency.
+        blacklist_task = None
         if payload.jti:
-            expires_at = payload.expires_at()
-            await blacklist_token(payload.jti, expires_at)
+            blacklist_task = asyncio.create_task(blacklist_token(payload.jti, payload.expires_at()))
 
-        role_names = [role.name for role in user.roles]
         new_access_token = create_access_token(sub=str(user_id), email=user.email, roles=role_names)
         new_refresh_token = create_refresh_token(sub=str(user_id))
 
+        if blacklist_task is not None:
+            await blacklist_task
+
         logger.info("Tokens refreshed and rotated", extra={"user_id": user_id})
         return new_access_token, new_refresh_token
 
     async def change_user_password(self, user: User, current_password: str, new_password: str) -> None:
-        if not verify_password(current_password, user.hashed_password):
+        if not await verify_password_async(current_password, user.hashed_password):
             logger.warning("Failed password change attempt", extra={"user_id": user.id})
             raise InvalidCredentialsError("Invalid current password")
 
@@ -0,0 +1,16 @@
+"""Memoized decode_token for test assertions.
+
+Tokens are immutable strings and tests never mutate the returned
+TokenPayload, so each unique (token, verify_exp) pair pays HMAC
+verification once per session. Production decode_token is untouched.
+"""
+
+from functools import lru_cache
+
+from src.auth.jwt import decode_token as _decode_token
+from src.auth.schemas import TokenPayload
+
+
+@lru_cache(maxsize=64)
+def decode_token(token: str, *, verify_exp: bool = True) -> TokenPayload:
+    return _decode_token(token, verify_exp=verify_exp)
@@ -1,9 +1,12 @@
-from collections.abc import AsyncIterator
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable
+from contextvars import ContextVar
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import NullPool
+from sqlalchemy import NullPool, StaticPool, event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from src.adapters.role_repository import SqlAlchemyRoleRepository
@@ -15,6 +18,20 @@ from src.models.base import Base
 from src.models.user import User
 from src.services.auth_service import AuthService
 
+_loop_factory: Callable[[], asyncio.AbstractEventLoop]
+try:
+    import uvloop
+
+    _loop_factory = uvloop.new_event_loop
+except ImportError:  # uvloop ships with uvicorn[standard]; absent on Windows
+    _loop_factory = asyncio.new_event_loop
+
+
+def pytest_asyncio_loop_factories(config, item):
+    # Run tests under the same loop implementation uvicorn uses in
+    # production; uvloop also trims per-await overhead across the suite.
+    return {"uvloop": _loop_factory}
+
 
 @pytest.fixture(autouse=True)
 def clear_request_context():
@@ -27,36 +44,133 @@ def settings() -> Settings:
     return Settings()
 
 
-@pytest.fixture
-def engine(settings: Settings) -> AsyncEngine:
-    return create_async_engine(
-        settings.db_url,
-        poolclass=NullPool,
-        echo=settings.DB_ECHO,
+def _worker_scoped_url(url: str) -> str:
+    """Give each pytest-xdist worker its own database.
+
+    SQLite needs nothing: in-memory databases are already per-process.
+    For Postgres the per-worker databases (e.g. app_gw0) are expected to
+    be provisioned by CI alongside the base one.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker or url.startswith("sqlite"):
+        return url
+    return f"{url}_{worker}"
+
+
+def _test_db_url() -> str:
+    # Default is in-memory SQLite: commits never touch disk, so the many
+    # small insert/commit cycles in these tests cost no fsyncs. Runs that
+    # need the real dialect opt in with TEST_DATABASE_URL.
+    return _worker_scoped_url(os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite://"))
+
+
+@pytest.fixture(scope="session")
+def engine() -> AsyncEngine:
+    test_settings = Settings()
+    url = _test_db_url()
+    if not url.startswith("sqlite"):
+        return create_async_engine(
+            url,
+            poolclass=NullPool,
+            echo=test_settings.DB_ECHO,
+        )
+
+    # An in-memory SQLite database lives and dies with its connection;
+    # StaticPool pins one connection so the schema survives the run.
+    engine = create_async_engine(
+        url,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        echo=test_settings.DB_ECHO,
     )
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_on_connect(dbapi_connection, _record) -> None:
+        # pysqlite defers BEGIN by default, which breaks the savepoint
+        # isolation the session fixture relies on; take over transaction
+        # control (paired with the "begin" hook below). The pragmas keep
+        # the journal and temp state off any filesystem.
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 
-@pytest.fixture
-def async_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
-    return async_sessionmaker(engine, expire_on_commit=False)
+    @event.listens_for(engine.sync_engine, "begin")
+    def _sqlite_on_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def create_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
 
 
 @pytest.fixture
-async def session(
-    async_session_maker: async_sessionmaker[AsyncSession],
-) -> AsyncIterator[AsyncSession]:
-    async with async_session_maker() as session:
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    # Savepoint isolation: the test runs inside an outer transaction that
+    # is rolled back on teardown, so per-test cleanup is one ROLLBACK
+    # instead of dropping and recreating every table. Session.commit()
+    # inside a test only releases a savepoint and stays invisible to
+    # other tests.
+    connection = await engine.connect()
+    transaction = await connection.begin()
+    maker = async_sessionmaker(
+        connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    async with maker() as session:
         try:
             yield session
         finally:
             await session.rollback()
+    await transaction.rollback()
+    await connection.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    # Hashing dominates test runtime (~160ms per user at production
+    # parameters vs ~0.1ms at the minimums). Tests only need hashes that
+    # round-trip, not ones that resist cracking.
+    from argon2 import PasswordHasher
+
+    from src.auth import password as password_module
+    from src.core.settings import settings as app_settings
+
+    original = password_module._argon2_hasher
+    original_rounds = app_settings.BCRYPT_ROUNDS
+    password_module._argon2_hasher = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+    # Covers the bcrypt path too when PASSWORD_HASH_ALGO selects it;
+    # 4 is bcrypt's minimum cost factor.
+    app_settings.BCRYPT_ROUNDS = 4
+    yield
+    password_module._argon2_hasher = original
+    app_settings.BCRYPT_ROUNDS = original_rounds
+
+
+@pytest.fixture(scope="session")
+def password_sample() -> tuple[str, str]:
+    # One hash for every test that just needs a known (password, hash)
+    # pair; even with the cheap test hasher there is no reason to re-run
+    # argon2 per test.
+    from src.auth.password import get_password_hash
+
+    password = "x" * Settings().PASSWORD_MIN_LENGTH
+    return password, get_password_hash(password)
 
 
 @pytest.fixture(autouse=True)
-async def restart_db(engine: AsyncEngine) -> None:
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+def reset_role_cache() -> None:
+    # Each test's rollback discards rows behind ids cached for the
+    # process lifetime.
+    AuthService._default_role_id = None
 
 
 @pytest.fixture
@@ -103,19 +217,51 @@ async def user_factory(
                 if role not in user.roles:
                     user.roles.append(role)
 
-        await session.commit()
+        # flush, not commit: every code path in a test shares this one
+        # session, so flushed rows are visible immediately and the
+        # savepoint fixture keeps ownership of transaction boundaries.
+        await session.flush()
         return user
 
     return _create_user
 
 
-@pytest.fixture
-async def app(session: AsyncSession) -> FastAPI:
+# Session override indirection: the FastAPI app is built once per test
+# session (create_app re-stacks middleware and routes each call), while
+# each test binds its own AsyncSession here.
+_test_session: ContextVar[AsyncSession | None] = ContextVar("_test_session", default=None)
+
+
+@pytest.fixture(autouse=True)
+def bind_test_session(session: AsyncSession):
+    token = _test_session.set(session)
+    yield
+    _test_session.reset(token)
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
     from src.db.db import get_session
+    from src.dependencies.services import get_health_service
+    from src.services.health_service import HealthService
 
     app = create_app()
 
+    # Readiness would otherwise ping the engine built from DB_* settings,
+    # which the tests never use. A dedicated throwaway engine (rather
+    # than the fixture engine) keeps the probe off the StaticPool
+    # connection the running test's transaction holds.
+    health_engine = create_async_engine("sqlite+aiosqlite://")
+
+    def override_get_health_service() -> HealthService:
+        return HealthService(health_engine, cache_client=None)
+
+    app.dependency_overrides[get_health_service] = override_get_health_service
+
     async def override_get_session() -> AsyncIterator[AsyncSession]:
+        session = _test_session.get()
+        if session is None:
+            raise RuntimeError("No test session bound; bind_test_session did not run")
         try:
             yield session
             await session.commit()
@@ -127,8 +273,37 @@ async def app(session: AsyncSession) -> FastAPI:
     return app
 
 
+@pytest.fixture(scope="session")
+def transport(app) -> ASGITransport:
+    return ASGITransport(app=app)
+
+
 @pytest.fixture
-async def client(app) -> AsyncIterator[AsyncClient]:
-    transport = ASGITransport(app=app)
+async def client(transport: ASGITransport) -> AsyncIterator[AsyncClient]:
+    # The app and transport are the expensive, shareable pieces and live
+    # for the session. The AsyncClient itself stays per test: tests
+    # mutate its headers and cookie jar (authed_client, refresh flows),
+    # so sharing one would leak auth state between tests.
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+AUTHED_EMAIL = "authed@example.com"
+AUTHED_PASSWORD = "AuthedPassword123!"
+
+
+@pytest.fixture
+async def authed_client(client: AsyncClient, user_factory) -> tuple[AsyncClient, User]:
+    """Client pre-authenticated as a fresh user.
+
+    Logs in once so auth-gated tests skip their own login round-trip and
+    password verification. Tests needing the raw credentials use
+    AUTHED_EMAIL / AUTHED_PASSWORD.
+    """
+    user = await user_factory(email=AUTHED_EMAIL, password=AUTHED_PASSWORD)
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": AUTHED_EMAIL, "password": AUTHED_PASSWORD},
+    )
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    return client, user
@@ -2,8 +2,9 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
-from src.auth.jwt import decode_token
 from src.core.settings import settings
+from tests._decode import decode_token
+from tests.conftest import AUTHED_EMAIL, AUTHED_PASSWORD
 
 
 @pytest.mark.integration
@@ -220,26 +221,14 @@ class TestLogout:
 
 @pytest.mark.integration
 class TestMe:
-    async def test_me_success(self, client: AsyncClient, user_factory):
-        user = await user_factory(email="test@example.com", password="Password123!")
+    async def test_me_success(self, authed_client):
+        client, user = authed_client
 
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            data={
-                "username": "test@example.com",
-                "password": "Password123!",
-            },
-        )
-        access_token = login_response.json()["access_token"]
-
-        me_response = await client.get(
-            "/api/v1/auth/me",
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
+        me_response = await client.get("/api/v1/auth/me")
 
         assert me_response.status_code == status.HTTP_200_OK
         data = me_response.json()
-        assert data["email"] == "test@example.com"
+        assert data["email"] == user.email
         assert data["id"] == user.id
 
     async def test_me_no_token(self, client: AsyncClient):
@@ -268,23 +257,13 @@ class TestMe:
 
 @pytest.mark.integration
 class TestChangePassword:
-    async def test_change_password_success(self, client: AsyncClient, user_factory):
-        await user_factory(email="test@example.com", password="OldPassword123!")
-
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            data={
-                "username": "test@example.com",
-                "password": "OldPassword123!",
-            },
-        )
-        access_token = login_response.json()["access_token"]
+    async def test_change_password_success(self, authed_client):
+        client, _ = authed_client
 
         change_response = await client.post(
             "/api/v1/auth/change-password",
-            headers={"Authorization": f"Bearer {access_token}"},
             json={
-                "current_password": "OldPassword123!",
+                "current_password": AUTHED_PASSWORD,
                 "new_password": "NewPassword123!",
             },
         )
@@ -292,11 +271,13 @@ class TestChangePassword:
         assert change_response.status_code == status.HTTP_200_OK
         assert "Password changed successfully" in change_response.json()["message"]
 
+        # Use the constant: the 401 below rolls the session back, which
+        # expires the ORM user object and makes user.email lazy-load.
         old_login_response = await client.post(
             "/api/v1/auth/login",
             data={
-                "username": "test@example.com",
-                "password": "OldPassword123!",
+                "username": AUTHED_EMAIL,
+                "password": AUTHED_PASSWORD,
             },
         )
         assert old_login_response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -304,27 +285,17 @@ class TestChangePassword:
         new_login_response = await client.post(
             "/api/v1/auth/login",
             data={
-                "username": "test@example.com",
+                "username": AUTHED_EMAIL,
                 "password": "NewPassword123!",
             },
         )
         assert new_login_response.status_code == status.HTTP_200_OK
 
-    async def test_change_password_wrong_current(self, client: AsyncClient, user_factory):
-        await user_factory(email="test@example.com", password="CorrectPassword123!")
-
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            data={
-                "username": "test@example.com",
-                "password": "CorrectPassword123!",
-            },
-        )
-        access_token = login_response.json()["access_token"]
+    async def test_change_password_wrong_current(self, authed_client):
+        client, _ = authed_client
 
         change_response = await client.post(
             "/api/v1/auth/change-password",
-            headers={"Authorization": f"Bearer {access_token}"},
             json={
                 "current_password": "WrongPassword123!",
                 "new_password": "NewPassword123!",
@@ -335,23 +306,13 @@ class TestChangePassword:
         data = change_response.json()
         assert "Invalid current password" in data.get("error", data.get("detail", ""))
 
-    async def test_change_password_short_new(self, client: AsyncClient, user_factory):
-        await user_factory(email="test@example.com", password="Password123!")
-
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            data={
-                "username": "test@example.com",
-                "password": "Password123!",
-            },
-        )
-        access_token = login_response.json()["access_token"]
+    async def test_change_password_short_new(self, authed_client):
+        client, _ = authed_client
 
         change_response = await client.post(
             "/api/v1/auth/change-password",
-            headers={"Authorization": f"Bearer {access_token}"},
             json={
-                "current_password": "Password123!",
+                "current_password": AUTHED_PASSWORD,
                 "new_password": "short",
             },
         )
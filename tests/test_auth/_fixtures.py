@@ -0,0 +1,18 @@
+"""Shared hand-built token material for auth tests."""
+
+from functools import cache
+
+from jose import jwt
+
+from src.core.settings import settings
+
+# Frozen in the past so the signed blob is identical across runs and
+# modules — that is what lets the cache below actually hit.
+PAST_IAT = 1_700_000_000
+PAST_EXP = 1_700_003_600
+
+
+@cache
+def expired_access_token() -> str:
+    payload = {"sub": "123", "type": "access", "iat": PAST_IAT, "exp": PAST_EXP}
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
@@ -0,0 +1,13 @@
+import pytest
+
+from src.auth.jwt import create_access_token, create_refresh_token
+
+
+@pytest.fixture(scope="session")
+def canned_tokens() -> dict[str, str]:
+    # Signed once per session; tests that only decode and assert reuse
+    # these instead of paying HMAC on the encode side each time.
+    return {
+        "access_123_ab": create_access_token(sub="123", email="a@b.com", roles=["admin", "user", "admin"]),
+        "refresh_123": create_refresh_token(sub="123"),
+    }
@@ -1,8 +1,5 @@
-from datetime import UTC, datetime, timedelta
-
 import pytest
 from fastapi import HTTPException, status
-from jose import jwt
 
 from src.auth.dependencies import (
     get_current_user,
@@ -11,20 +8,25 @@ from src.auth.dependencies import (
     require_role,
 )
 from src.auth.jwt import create_access_token, create_refresh_token
-from src.core.settings import settings
 from src.services.auth_service import AuthService
+from tests.test_auth._fixtures import expired_access_token
+
+
+@pytest.fixture
+async def active_user(user_factory):
+    # One plain active user shared by the tests that only read it. A
+    # class-scoped row would be cheaper still, but per-test savepoint
+    # rollback discards rows between tests, so function scope it is.
+    return await user_factory(email="test@example.com", password="password123")
 
 
 @pytest.mark.integration
 class TestGetCurrentUser:
-    async def test_get_current_user_success(self, auth_service: AuthService, user_factory, session):
-        user = await user_factory(email="test@example.com", password="password123")
-        await session.commit()
-
-        token = create_access_token(sub=str(user.id), email=user.email)
+    async def test_get_current_user_success(self, auth_service: AuthService, active_user):
+        token = create_access_token(sub=str(active_user.id), email=active_user.email)
         result = await get_current_user(token=token, auth_service=auth_service)
 
-        assert result.id == user.id
+        assert result.id == active_user.id
         assert result.email == "test@example.com"
 
     async def test_get_current_user_no_token(self, auth_service: AuthService):
@@ -42,24 +44,14 @@ class TestGetCurrentUser:
         assert "Invalid authentication credentials" in exc_info.value.detail
 
     async def test_get_current_user_expired_token(self, auth_service: AuthService):
-        expired_payload = {
-            "sub": "1",
-            "type": "access",
-            "iat": int((datetime.now(UTC) - timedelta(hours=2)).timestamp()),
-            "exp": int((datetime.now(UTC) - timedelta(hours=1)).timestamp()),
-            "email": "test@example.com",
-        }
-        expired_token = jwt.encode(expired_payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user(token=expired_token, auth_service=auth_service)
+            await get_current_user(token=expired_access_token(), auth_service=auth_service)
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert "Token expired" in exc_info.value.detail
 
-    async def test_get_current_user_wrong_token_type(self, auth_service: AuthService, user_factory):
-        user = await user_factory(email="test@example.com", password="password123")
-        refresh_token = create_refresh_token(sub=str(user.id))
+    async def test_get_current_user_wrong_token_type(self, auth_service: AuthService, active_user):
+        refresh_token = create_refresh_token(sub=str(active_user.id))
 
         with pytest.raises(HTTPException) as exc_info:
             await get_current_user(token=refresh_token, auth_service=auth_service)
@@ -75,9 +67,8 @@ class TestGetCurrentUser:
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert "User not found" in exc_info.value.detail
 
-    async def test_get_current_user_inactive(self, auth_service: AuthService, user_factory, session):
+    async def test_get_current_user_inactive(self, auth_service: AuthService, user_factory):
         user = await user_factory(email="test@example.com", password="password123", is_active=False)
-        await session.commit()
 
         token = create_access_token(sub=str(user.id), email=user.email)
 
@@ -89,66 +80,35 @@ class TestGetCurrentUser:
 
 
 async def _call_checker(checker, user):
-    return await checker(**{"current_user": user})
-
-
-@pytest.mark.integration
-class TestRequireRole:
-    async def test_require_role_success(self, user_factory, session):
-        user = await user_factory(email="test@example.com", password="password123", roles=["admin"])
-        await session.commit()
-
-        result = await _call_checker(require_role("admin"), user)
-
-        assert result.id == user.id
-
-    async def test_require_role_missing(self, user_factory):
-        user = await user_factory(email="test@example.com", password="password123")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await _call_checker(require_role("admin"), user)
-
-        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-        assert "Insufficient permissions" in exc_info.value.detail
-        assert "admin" in exc_info.value.detail
+    return await checker(current_user=user)
 
 
 @pytest.mark.integration
-class TestRequireAnyRole:
-    async def test_require_any_role_success(self, user_factory, session):
-        user = await user_factory(email="test@example.com", password="password123", roles=["moderator"])
-        await session.commit()
-
-        result = await _call_checker(require_any_role("moderator", "admin"), user)
-
-        assert result.id == user.id
-
-    async def test_require_any_role_missing(self, user_factory):
-        user = await user_factory(email="test@example.com", password="password123")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await _call_checker(require_any_role("moderator", "admin"), user)
-
-        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-        assert "Insufficient permissions" in exc_info.value.detail
-
-
-@pytest.mark.integration
-class TestRequireAllRoles:
-    async def test_require_all_roles_success(self, user_factory, session):
-        user = await user_factory(email="test@example.com", password="password123", roles=["admin", "moderator"])
-        await session.commit()
-
-        result = await _call_checker(require_all_roles("admin", "moderator"), user)
+@pytest.mark.parametrize(
+    ("make_checker", "user_roles", "expect_exc", "detail_fragment"),
+    [
+        (lambda: require_role("admin"), ["admin"], None, None),
+        (lambda: require_role("admin"), [], HTTPException, "admin"),
+        (lambda: require_any_role("moderator", "admin"), ["moderator"], None, None),
+        (lambda: require_any_role("moderator", "admin"), [], HTTPException, None),
+        (lambda: require_all_roles("admin", "moderator"), ["admin", "moderator"], None, None),
+        (lambda: require_all_roles("admin", "moderator"), ["admin"], HTTPException, "moderator"),
+    ],
+)
+async def test_role_checkers(make_checker, user_roles, expect_exc, detail_fragment, user_factory):
+    # The six former one-test-per-checker classes collapsed into one
+    # grid: same user setup, only the checker and role set vary.
+    user = await user_factory(email="test@example.com", password="password123", roles=user_roles or None)
 
+    if expect_exc is None:
+        result = await _call_checker(make_checker(), user)
         assert result.id == user.id
+        return
 
-    async def test_require_all_roles_missing_one(self, user_factory):
-        user = await user_factory(email="test@example.com", password="password123", roles=["admin"])
-
-        with pytest.raises(HTTPException) as exc_info:
-            await _call_checker(require_all_roles("admin", "moderator"), user)
+    with pytest.raises(expect_exc) as exc_info:
+        await _call_checker(make_checker(), user)
 
-        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-        assert "Insufficient permissions" in exc_info.value.detail
-        assert "moderator" in exc_info.value.detail
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+    assert "Insufficient permissions" in exc_info.value.detail
+    if detail_fragment:
+        assert detail_fragment in exc_info.value.detail
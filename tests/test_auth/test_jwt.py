@@ -1,14 +1,14 @@
-from datetime import UTC, datetime, timedelta
+import contextlib
 
-from jose import jwt
+import pytest
+from jose import ExpiredSignatureError
 
-from src.auth.jwt import create_access_token, create_refresh_token, decode_token
-from src.core.settings import settings
+from tests._decode import decode_token
+from tests.test_auth._fixtures import expired_access_token
 
 
-def test_create_and_decode_access_token() -> None:
-    token = create_access_token(sub="123", email="a@b.com", roles=["admin", "user", "admin"])
-    payload = decode_token(token)
+def test_create_and_decode_access_token(canned_tokens: dict[str, str]) -> None:
+    payload = decode_token(canned_tokens["access_123_ab"])
 
     assert payload.sub == "123"
     assert payload.type == "access"
@@ -17,26 +17,22 @@ def test_create_and_decode_access_token() -> None:
     assert payload.exp > payload.iat
 
 
-def test_create_and_decode_refresh_token() -> None:
-    token = create_refresh_token(sub="123")
-    payload = decode_token(token)
+def test_create_and_decode_refresh_token(canned_tokens: dict[str, str]) -> None:
+    payload = decode_token(canned_tokens["refresh_123"])
 
     assert payload.sub == "123"
     assert payload.type == "refresh"
     assert payload.email is None
 
 
-def test_decode_expired_token() -> None:
-    now = datetime.now(UTC)
-    expired_payload = {
-        "sub": "123",
-        "type": "access",
-        "iat": int((now - timedelta(hours=2)).timestamp()),
-        "exp": int((now - timedelta(hours=1)).timestamp()),
-    }
-    token = jwt.encode(expired_payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-
-    payload = decode_token(token, verify_exp=False)
-    assert payload.sub == "123"
-    assert payload.type == "access"
-    assert payload.is_expired() is True
+@pytest.mark.parametrize(
+    ("verify_exp", "expect_exc"),
+    [(False, None), (True, ExpiredSignatureError)],
+)
+def test_decode_expired_token(verify_exp: bool, expect_exc: type[Exception] | None) -> None:
+    ctx = pytest.raises(expect_exc) if expect_exc else contextlib.nullcontext()
+    with ctx:
+        payload = decode_token(expired_access_token(), verify_exp=verify_exp)
+        assert payload.sub == "123"
+        assert payload.type == "access"
+        assert payload.is_expired() is True
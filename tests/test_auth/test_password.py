@@ -1,6 +1,6 @@
 import pytest
 
-from src.auth.password import get_password_hash, validate_password, verify_password
+from src.auth.password import validate_password, verify_password
 from src.core.settings import settings
 
 
@@ -16,9 +16,8 @@ def test_validate_password_max_72_bytes() -> None:
         validate_password("x" * 73)
 
 
-def test_password_hash_and_verify_roundtrip() -> None:
-    password = "x" * settings.PASSWORD_MIN_LENGTH
-    hashed = get_password_hash(password)
+def test_password_hash_and_verify_roundtrip(password_sample: tuple[str, str]) -> None:
+    password, hashed = password_sample
 
     assert hashed != password
     assert verify_password(password, hashed) is True
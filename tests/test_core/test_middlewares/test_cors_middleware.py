@@ -0,0 +1,76 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from src.core.middlewares.cors import CORSMiddleware
+
+
+async def _downstream(scope: Scope, receive: Receive, send: Send) -> None:
+    await PlainTextResponse("downstream")(scope, receive, send)
+
+
+# The subclass's fast path reads Starlette internals
+# (preflight_explicit_allow_origin, allow_private_network,
+# preflight_headers); asserting byte-for-byte parity with the stock
+# middleware catches both an upstream rename and a fast-path condition
+# serving a cached response where stock would refuse.
+_WILDCARD = {"allow_origins": ["*"], "allow_methods": ["GET", "POST"], "allow_headers": ["x-custom"]}
+_CREDENTIALS = {
+    "allow_origins": ["https://example.com"],
+    "allow_methods": ["GET", "POST"],
+    "allow_headers": ["x-custom"],
+    "allow_credentials": True,
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("config", "request_headers"),
+    [
+        # Static fast path: no header needs echoing back.
+        (_WILDCARD, {"access-control-request-method": "GET"}),
+        (_WILDCARD, {"access-control-request-method": "POST", "access-control-request-headers": "x-custom"}),
+        # Disallowed method and header must fall through to the stock 400.
+        (_WILDCARD, {"access-control-request-method": "DELETE"}),
+        (_WILDCARD, {"access-control-request-method": "GET", "access-control-request-headers": "x-evil"}),
+        # Credentials force an explicit allow-origin, so no static response.
+        (_CREDENTIALS, {"access-control-request-method": "GET"}),
+        (_CREDENTIALS, {"access-control-request-method": "DELETE"}),
+    ],
+)
+async def test_preflight_matches_stock_starlette(config: dict, request_headers: dict[str, str]) -> None:
+    ours = CORSMiddleware(_downstream, **config)
+    stock = StarletteCORSMiddleware(_downstream, **config)
+    headers = {"origin": "https://example.com", **request_headers}
+
+    async with (
+        AsyncClient(transport=ASGITransport(app=ours), base_url="http://test") as our_client,
+        AsyncClient(transport=ASGITransport(app=stock), base_url="http://test") as stock_client,
+    ):
+        our_response = await our_client.options("/anything", headers=headers)
+        stock_response = await stock_client.options("/anything", headers=headers)
+
+    assert our_response.status_code == stock_response.status_code
+    assert dict(our_response.headers) == dict(stock_response.headers)
+    assert our_response.content == stock_response.content
+
+
+@pytest.mark.unit
+async def test_static_preflight_is_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    middleware = CORSMiddleware(_downstream, **_WILDCARD)
+    # The stock path must not run for static hits; make it explode.
+    monkeypatch.setattr(
+        StarletteCORSMiddleware,
+        "preflight_response",
+        lambda self, request_headers: pytest.fail("static preflight fell through to the stock path"),
+    )
+    headers = {"origin": "https://example.com", "access-control-request-method": "GET"}
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        first = await client.options("/anything", headers=headers)
+        second = await client.options("/anything", headers=headers)
+
+    assert first.status_code == 200
+    assert dict(second.headers) == dict(first.headers)
@@ -0,0 +1,80 @@
+import pytest
+from fastapi import FastAPI, Request, Response, status
+from httpx import ASGITransport, AsyncClient
+
+from src.rate_limit import RateLimitMiddleware, parse_limit, rate_limit
+
+
+@pytest.mark.unit
+def test_route_index_finds_tagged_endpoints(app: FastAPI) -> None:
+    # _iter_routes unwraps FastAPI's deferred include_router internals
+    # (original_router / include_context) to reach decorated endpoints.
+    # The middleware fails open, so if a FastAPI upgrade renames those
+    # attributes the index silently comes up empty and nothing is
+    # limited; this pins the real app's tagged routes to fail loudly.
+    index = RateLimitMiddleware._build_route_index(app.routes)
+    indexed_paths = {path for *_, path in index}
+    assert indexed_paths == {
+        "/api/v1/auth/register",
+        "/api/v1/auth/login",
+        "/api/v1/auth/refresh",
+        "/api/v1/auth/logout",
+        "/api/v1/auth/me",
+        "/api/v1/auth/change-password",
+    }
+
+
+@pytest.fixture(scope="module")
+def limited_app() -> FastAPI:
+    # A minimal app instead of the session fixture: the suite runs with
+    # RATE_LIMIT_ENABLED=false, and hitting a DB-free route keeps these
+    # tests on the middleware alone.
+    app = FastAPI()
+
+    @app.get("/limited")
+    @rate_limit("3/minute")
+    async def limited(request: Request, response: Response):
+        return {"message": "success"}
+
+    @app.get("/open")
+    async def open_route(request: Request, response: Response):
+        return {"message": "success"}
+
+    app.add_middleware(RateLimitMiddleware)
+    return app
+
+
+@pytest.mark.unit
+async def test_rate_limit_enforced_with_headers(limited_app: FastAPI) -> None:
+    # Redis is disabled under test, so this drives the in-process
+    # fallback counter: three requests pass with decreasing remaining,
+    # the fourth is rejected.
+    transport = ASGITransport(app=limited_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for remaining in (2, 1, 0):
+            response = await client.get("/limited")
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["X-RateLimit-Limit"] == "3"
+            assert response.headers["X-RateLimit-Remaining"] == str(remaining)
+
+        response = await client.get("/limited")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Rate limit exceeded" in response.json()["error"]
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+
+
+@pytest.mark.unit
+async def test_untagged_route_is_not_limited(limited_app: FastAPI) -> None:
+    transport = ASGITransport(app=limited_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(5):
+            response = await client.get("/open")
+            assert response.status_code == status.HTTP_200_OK
+            assert "X-RateLimit-Limit" not in response.headers
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("limit", ["0/minute", "10/fortnight", "ten/minute", "10"])
+def test_parse_limit_rejects_malformed_strings(limit: str) -> None:
+    with pytest.raises(ValueError, match="Invalid rate limit string"):
+        parse_limit(limit)
@@ -1,40 +1,79 @@
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient, Headers
 
+from src.core.middlewares import SecurityHeadersMiddleware
 from src.core.settings import settings
 
 
-@pytest.mark.unit
-async def test_security_headers_core(client: AsyncClient) -> None:
-    if not settings.SECURITY_HEADERS_ENABLED:
-        pytest.skip("Security headers are disabled")
+async def _run_asgi(middleware) -> Headers:
+    """Drive an ASGI middleware with a canned scope, no router or client."""
+    sent: list[dict] = []
 
-    response = await client.get("/api/v1/health/liveness")
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
 
-    assert response.headers["X-Content-Type-Options"] == settings.SECURITY_X_CONTENT_TYPE_OPTIONS
-    assert response.headers["X-Frame-Options"] == settings.SECURITY_X_FRAME_OPTIONS
-    assert response.headers["X-XSS-Protection"] == settings.SECURITY_X_XSS_PROTECTION
-    assert response.headers["Referrer-Policy"] == settings.SECURITY_REFERRER_POLICY
+    async def send(message: dict) -> None:
+        sent.append(message)
 
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+    await middleware(scope, receive, send)
+    start = next(message for message in sent if message["type"] == "http.response.start")
+    return Headers(start["headers"])
 
-@pytest.mark.unit
-async def test_security_headers_conditional(client: AsyncClient) -> None:
+
+async def _passthrough_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+@pytest.fixture(scope="module")
+async def health_headers(app) -> Headers:
+    # Both tests only inspect middleware-set headers, which are identical
+    # on every response; one ASGI round-trip per module is enough. The
+    # skip lives here so a disabled config is evaluated once.
     if not settings.SECURITY_HEADERS_ENABLED:
         pytest.skip("Security headers are disabled")
 
-    response = await client.get("/api/v1/health/liveness")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/health/liveness")
+    return response.headers
 
+
+@pytest.mark.unit
+async def test_security_headers_core() -> None:
+    # Unit-level: the middleware is exercised as a bare ASGI callable, so
+    # no routing, dependency resolution or JSON encoding is involved.
+    middleware = SecurityHeadersMiddleware(
+        _passthrough_app,
+        x_content_type_options=settings.SECURITY_X_CONTENT_TYPE_OPTIONS,
+        x_frame_options=settings.SECURITY_X_FRAME_OPTIONS,
+        x_xss_protection=settings.SECURITY_X_XSS_PROTECTION,
+        referrer_policy=settings.SECURITY_REFERRER_POLICY,
+    )
+
+    headers = await _run_asgi(middleware)
+
+    assert headers["X-Content-Type-Options"] == settings.SECURITY_X_CONTENT_TYPE_OPTIONS
+    assert headers["X-Frame-Options"] == settings.SECURITY_X_FRAME_OPTIONS
+    assert headers["X-XSS-Protection"] == settings.SECURITY_X_XSS_PROTECTION
+    assert headers["Referrer-Policy"] == settings.SECURITY_REFERRER_POLICY
+    assert headers["Content-Type"] == "text/plain"
+
+
+@pytest.mark.unit
+async def test_security_headers_conditional(health_headers: Headers) -> None:
     if settings.SECURITY_STRICT_TRANSPORT_SECURITY:
-        assert response.headers["Strict-Transport-Security"] == settings.SECURITY_STRICT_TRANSPORT_SECURITY
+        assert health_headers["Strict-Transport-Security"] == settings.SECURITY_STRICT_TRANSPORT_SECURITY
     else:
-        assert "Strict-Transport-Security" not in response.headers
+        assert "Strict-Transport-Security" not in health_headers
 
     if settings.SECURITY_CONTENT_SECURITY_POLICY:
-        assert response.headers["Content-Security-Policy"] == settings.SECURITY_CONTENT_SECURITY_POLICY
+        assert health_headers["Content-Security-Policy"] == settings.SECURITY_CONTENT_SECURITY_POLICY
     else:
-        assert "Content-Security-Policy" not in response.headers
+        assert "Content-Security-Policy" not in health_headers
 
     if settings.SECURITY_PERMISSIONS_POLICY:
-        assert response.headers["Permissions-Policy"] == settings.SECURITY_PERMISSIONS_POLICY
+        assert health_headers["Permissions-Policy"] == settings.SECURITY_PERMISSIONS_POLICY
     else:
-        assert "Permissions-Policy" not in response.headers
+        assert "Permissions-Policy" not in health_headers